@@ -12,9 +12,23 @@ Strategy:
 5. Score overall quality
 """
 
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, FrozenSet
+from collections import Counter
 import re
 
+from ..text_tables import PUNCT_TABLE
+
+# Sentence boundary pattern shared by the logic and sentence checks
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+
+# "this"/"these"/"that"/"such" without a following noun, in one scan
+DANGLING_REF_PATTERN = re.compile(r'\b(?:this|these|that|such)\b(?!\s+\w)')
+
+# Conjunctions that make an abrupt opening word
+ABRUPT_STARTERS: FrozenSet[str] = frozenset({
+    'however', 'therefore', 'thus', 'hence', 'so', 'but', 'and'
+})
+
 
 def run(processed_input: Dict[str, Any],
         encoding: Dict[str, Any],
@@ -49,23 +63,26 @@ def run(processed_input: Dict[str, Any],
     issues = []
     suggestions = []
     
+    # Tokenize and split the summary once for all checks
+    stats = analyze_summary(summary)
+    
     # Step 1: Check compression ratio
-    summary_word_count = len(summary.split())
+    summary_word_count = len(stats['words'])
     compression_ratio = 1 - (summary_word_count / max(original_word_count, 1))
     compression_issues = check_compression(compression_ratio, original_word_count)
     issues.extend(compression_issues)
     
     # Step 2: Check keyword coverage
-    keyword_issues = check_keyword_coverage(summary, keywords)
+    keyword_issues = check_keyword_coverage(stats, keywords)
     issues.extend(keyword_issues['issues'])
     suggestions.extend(keyword_issues['suggestions'])
     
     # Step 3: Check for logical completeness
-    logic_issues = check_logic(summary, sentences)
+    logic_issues = check_logic(stats, sentences)
     issues.extend(logic_issues)
     
     # Step 4: Check sentence quality
-    sentence_issues = check_sentence_quality(summary)
+    sentence_issues = check_sentence_quality(stats)
     issues.extend(sentence_issues)
     
     # Step 5: Determine overall quality
@@ -84,6 +101,32 @@ def run(processed_input: Dict[str, Any],
     }
 
 
+def analyze_summary(summary: str) -> Dict[str, Any]:
+    """
+    Derive everything the checks need from the summary in one place.
+    
+    Returns dictionary containing:
+    - lower: Lowercased summary
+    - words: Whitespace tokens of the summary
+    - sentences: Non-empty sentences
+    - sentence_word_counts: Word count of each sentence
+    - word_counts: Counts of substantial (6+ letter) lowercased words
+    """
+    lower = summary.lower()
+    sentences = [s for s in SENTENCE_END_PATTERN.split(summary) if s.strip()]
+    
+    # Punctuation removed in one C-level pass before counting
+    stripped_words = lower.translate(PUNCT_TABLE).split()
+    
+    return {
+        "lower": lower,
+        "words": summary.split(),
+        "sentences": sentences,
+        "sentence_word_counts": [len(s.split()) for s in sentences],
+        "word_counts": Counter(w for w in stripped_words if len(w) > 5)
+    }
+
+
 def check_compression(ratio: float, original_words: int) -> List[str]:
     """
     Check if compression ratio is appropriate.
@@ -105,12 +148,14 @@ def check_compression(ratio: float, original_words: int) -> List[str]:
     return issues
 
 
-def check_keyword_coverage(summary: str, 
+def check_keyword_coverage(stats: Dict[str, Any], 
                           keywords: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Check if important keywords are covered in summary.
+    
+    stats is the output of analyze_summary().
     """
-    summary_lower = summary.lower()
+    summary_lower = stats['lower']
     top_keywords = [kw['term'] for kw in keywords[:10]]
     
     covered = []
@@ -141,72 +186,56 @@ def check_keyword_coverage(summary: str,
     }
 
 
-def check_logic(summary: str, original_sentences: List[str]) -> List[str]:
+def check_logic(stats: Dict[str, Any], original_sentences: List[str]) -> List[str]:
     """
     Check for logical completeness and coherence.
+    
+    stats is the output of analyze_summary().
     """
     issues = []
+    summary_tokens = stats['words']
     
     # Check if summary has introduction-style content
-    summary_lower = summary.lower()
+    summary_lower = stats['lower']
     
     # Check for dangling references
-    dangling_refs = [
-        r'\bthis\b(?!\s+\w)',  # "this" without noun
-        r'\bthese\b(?!\s+\w)',
-        r'\bthat\b(?!\s+\w)',
-        r'\bsuch\b(?!\s+\w)',
-    ]
-    
-    for pattern in dangling_refs:
-        if re.search(pattern, summary_lower):
-            # This is a very rough heuristic
-            pass  # Don't flag too aggressively
+    if DANGLING_REF_PATTERN.search(summary_lower):
+        # This is a very rough heuristic
+        pass  # Don't flag too aggressively
     
     # Check if summary starts abruptly
-    first_words = summary_lower.split()[:3] if summary else []
-    abrupt_starters = ['however', 'therefore', 'thus', 'hence', 'so', 'but', 'and']
-    
-    if first_words and first_words[0].strip('.,') in abrupt_starters:
+    if summary_tokens and summary_tokens[0].lower().strip('.,') in ABRUPT_STARTERS:
         issues.append("Summary may start abruptly with a conjunction")
     
     # Check sentence count
-    summary_sentences = [s for s in re.split(r'[.!?]+', summary) if s.strip()]
-    if len(summary_sentences) == 1 and len(summary.split()) > 30:
+    if len(stats['sentences']) == 1 and len(summary_tokens) > 30:
         issues.append("Consider breaking into multiple sentences for clarity")
     
     return issues
 
 
-def check_sentence_quality(summary: str) -> List[str]:
+def check_sentence_quality(stats: Dict[str, Any]) -> List[str]:
     """
     Check individual sentence quality.
+    
+    stats is the output of analyze_summary().
     """
     issues = []
-    sentences = [s for s in re.split(r'[.!?]+', summary) if s.strip()]
+    sentence_count = len(stats['sentences'])
     
-    for sentence in sentences:
-        words = sentence.split()
-        
+    for word_count in stats['sentence_word_counts']:
         # Very long sentence
-        if len(words) > 40:
+        if word_count > 40:
             issues.append("Contains overly long sentence (40+ words)")
             break  # Only report once
         
         # Very short sentence (might be incomplete)
-        if len(words) < 4 and len(sentences) > 1:
+        if word_count < 4 and sentence_count > 1:
             issues.append("Contains very short sentence; may be incomplete")
             break
     
     # Check for repetition
-    words = summary.lower().split()
-    word_counts: Dict[str, int] = {}
-    for word in words:
-        word = word.strip('.,!?;:')
-        if len(word) > 5:  # Only check substantial words
-            word_counts[word] = word_counts.get(word, 0) + 1
-    
-    repeated = [w for w, c in word_counts.items() if c > 3]
+    repeated = [w for w, c in stats['word_counts'].items() if c > 3]
     if repeated:
         issues.append(f"Word repetition detected: '{repeated[0]}'")
     
@@ -11,7 +11,12 @@ Strategy:
 4. Preserve essential facts and claims
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import heapq
+
+# Phrases suggesting the last sentence is a conclusion
+CONCLUSION_MARKERS = ('therefore', 'thus', 'in conclusion', 'finally',
+                      'overall', 'to summarize', 'in summary')
 
 
 def run(processed_input: Dict[str, Any], 
@@ -41,10 +46,13 @@ def run(processed_input: Dict[str, Any],
         }
     
     # Step 1: Select key sentences based on scores and position
-    selected_sentences = select_key_sentences(sentences, sentence_scores)
+    selected_indices = select_key_indices(sentences, sentence_scores)
+    selected_sentences = [sentences[i] for i in selected_indices]
     
-    # Step 2: Extract key points
-    key_points = extract_key_points(selected_sentences, keywords)
+    # Step 2: Extract key points (reusing the input processor's tokens)
+    sentence_words = processed_input.get('sentence_words')
+    selected_words = [sentence_words[i] for i in selected_indices] if sentence_words else None
+    key_points = extract_key_points(selected_sentences, keywords, selected_words)
     
     # Step 3: Build logical flow
     summary = build_summary(selected_sentences)
@@ -72,6 +80,18 @@ def select_key_sentences(sentences: List[str],
     - Include last sentence if it's a conclusion
     - Maintain original order
     """
+    return [sentences[i] for i in select_key_indices(sentences, scores, max_sentences)]
+
+
+def select_key_indices(sentences: List[str], 
+                       scores: List[float],
+                       max_sentences: int = 5) -> List[int]:
+    """
+    Select the indices of the most important sentences.
+    
+    Same strategy as select_key_sentences; indices are returned
+    in original order.
+    """
     if not sentences:
         return []
     
@@ -80,15 +100,19 @@ def select_key_sentences(sentences: List[str],
     # Calculate how many sentences to include
     target_count = min(max_sentences, max(2, n // 3))
     
-    # Create list of (index, score) tuples
-    scored_indices = list(enumerate(scores)) if scores else [(i, 0) for i in range(n)]
+    # Rank only the top candidates; nlargest keeps the same order as a
+    # full descending sort (ties by position) without sorting everything
+    if scores:
+        top_indices = heapq.nlargest(target_count, range(len(scores)),
+                                     key=scores.__getitem__)
+    else:
+        top_indices = list(range(min(target_count, n)))
     
     # Always include first sentence
     selected_indices = {0}
     
     # Add highest scoring sentences
-    sorted_by_score = sorted(scored_indices, key=lambda x: x[1], reverse=True)
-    for idx, score in sorted_by_score:
+    for idx in top_indices:
         if len(selected_indices) >= target_count:
             break
         selected_indices.add(idx)
@@ -97,32 +121,30 @@ def select_key_sentences(sentences: List[str],
     if n > 3 and n - 1 not in selected_indices:
         # Check if last sentence seems like a conclusion
         last_sent_lower = sentences[-1].lower()
-        conclusion_markers = ['therefore', 'thus', 'in conclusion', 'finally', 
-                            'overall', 'to summarize', 'in summary']
-        if any(marker in last_sent_lower for marker in conclusion_markers):
+        if any(marker in last_sent_lower for marker in CONCLUSION_MARKERS):
             selected_indices.add(n - 1)
     
-    # Return sentences in original order
-    ordered_indices = sorted(selected_indices)
-    return [sentences[i] for i in ordered_indices]
+    # Return indices in original order
+    return sorted(selected_indices)
 
 
 def extract_key_points(sentences: List[str], 
-                       keywords: List[Dict[str, Any]]) -> List[str]:
+                       keywords: List[Dict[str, Any]],
+                       sentence_words: Optional[List[List[str]]] = None) -> List[str]:
     """
     Extract key points from selected sentences.
     
     Each key point is a concise representation of a main idea.
+    sentence_words optionally holds the lowercased words of each sentence.
     """
     key_points = []
-    keyword_set = {kw['term'].lower() for kw in keywords[:10]}
+    keyword_set = frozenset(kw['term'] for kw in keywords[:10])  # Already lowercase
     
-    for sentence in sentences:
-        # Find which keywords this sentence addresses
-        words = sentence.lower().split()
-        matching_keywords = [w for w in words if w in keyword_set]
+    for i, sentence in enumerate(sentences):
+        # Keep the sentence if it addresses any keyword (stops at first hit)
+        words = sentence_words[i] if sentence_words else sentence.lower().split()
         
-        if matching_keywords:
+        if any(w in keyword_set for w in words):
             # Truncate long sentences for key points
             if len(sentence) > 100:
                 # Keep first part
@@ -15,6 +15,8 @@ Strategy:
 from typing import Dict, Any, List, Tuple
 import re
 
+from ..text_tables import VOWEL_TABLE
+
 
 # Complex word replacements
 SIMPLIFICATIONS: Dict[str, str] = {
@@ -59,6 +61,80 @@ SIMPLIFICATIONS: Dict[str, str] = {
     'circumstances': 'conditions'
 }
 
+# Wordy phrases and their concise replacements (empty = drop the phrase)
+REDUNDANT_PHRASES: Dict[str, str] = {
+    'in order to': 'to',
+    'due to the fact that': 'because',
+    'at this point in time': 'now',
+    'in the event that': 'if',
+    'for the purpose of': 'for',
+    'with regard to': 'about',
+    'in spite of the fact that': 'although',
+    'as a matter of fact': '',
+    'it is important to note that': '',
+    'it should be noted that': '',
+    'basically': '',
+    'actually': '',
+    'generally speaking': '',
+    'for all intents and purposes': ''
+}
+
+
+def _alternation(terms) -> str:
+    """Join terms into a regex alternation, longest first so overlaps resolve to the longer term."""
+    return '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+
+
+def _table_key(matched: str, table: Dict[str, Any]) -> str:
+    """
+    Find the table entry a case-insensitive match stands for.
+    
+    Usually that is the lowercased match, but Unicode case variants
+    ('İ', 'ı', 'ſ') match their ASCII letters while lowercasing to
+    something else, so those fall back to matching each entry.
+    """
+    key = matched.lower()
+    if key in table:
+        return key
+    return next(term for term in table if re.fullmatch(re.escape(term), matched, re.IGNORECASE))
+
+
+# Lower, capitalized and upper-case form of each replacement, built once
+SIMPLIFICATION_FORMS: Dict[str, Tuple[str, str, str]] = {
+    complex_word: (simple_word, simple_word.capitalize(), simple_word.upper())
+    for complex_word, simple_word in SIMPLIFICATIONS.items()
+}
+
+# One pattern per table so the text is scanned once, not once per entry
+SIMPLIFICATION_PATTERN = re.compile(_alternation(SIMPLIFICATIONS), re.IGNORECASE)
+REDUNDANCY_PATTERN = re.compile(r'\b(?:' + _alternation(REDUNDANT_PHRASES) + r')\b', re.IGNORECASE)
+
+# Sentence split markers and their priority (lower splits first)
+SPLIT_MARKERS: List[Tuple[str, int]] = [
+    ('; ', 0),           # Semicolons are great split points
+    (', and ', 1),       # Comma + conjunction
+    (', but ', 1),
+    (', or ', 1),
+    (', which ', 2),     # Relative clauses
+    (', that ', 2),
+    (' because ', 3),    # Causal
+    (' while ', 3),
+    (' although ', 3),
+]
+
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+LEADING_CONJUNCTION_PATTERN = re.compile(r'^(and|but|or|so|yet)\s+', re.IGNORECASE)
+LOWERCASE_START_PATTERN = re.compile(r'([.!?])\s+([a-z])')
+
+# Letter runs without any vowel group (still one syllable each)
+NO_VOWEL_WORD_PATTERN = re.compile(r'(?<![a-z])[b-df-hj-np-tv-xz]+(?![a-z])')
+
+# Letter runs ending in a silent e: a final e group preceded by another
+# vowel group. Only the last vowel before the final consonants is matched,
+# which avoids backtracking over the whole word.
+SILENT_E_PATTERN = re.compile(r'[aeiouy][b-df-hj-np-tv-xz]+[aeiouy]*e(?![a-z])')
+
 
 def run(processed_input: Dict[str, Any],
         encoding: Dict[str, Any],
@@ -87,8 +163,8 @@ def run(processed_input: Dict[str, Any],
             "confidence": 0.0
         }
     
-    # Calculate original metrics
-    original_metrics = calculate_readability(summary)
+    # Calculate original metrics (only the averages are compared)
+    original_metrics = calculate_readability(summary, include_flesch=False)
     
     # Step 1: Replace complex words
     simplified, word_changes = simplify_vocabulary(summary)
@@ -131,28 +207,17 @@ def simplify_vocabulary(text: str) -> Tuple[str, int]:
     
     Returns simplified text and count of changes made.
     """
-    result = text
-    changes = 0
-    
-    for complex_word, simple_word in SIMPLIFICATIONS.items():
-        # Case-insensitive replacement that preserves original case
-        pattern = re.compile(re.escape(complex_word), re.IGNORECASE)
-        matches = pattern.findall(result)
-        
-        if matches:
-            # Replace while trying to preserve case
-            def replace_case(match):
-                word = match.group(0)
-                if word.isupper():
-                    return simple_word.upper()
-                elif word[0].isupper():
-                    return simple_word.capitalize()
-                return simple_word
-            
-            result = pattern.sub(replace_case, result)
-            changes += len(matches)
-    
-    return result, changes
+    # Replace while trying to preserve case
+    def replace_case(match):
+        word = match.group(0)
+        lower, capitalized, upper = SIMPLIFICATION_FORMS[_table_key(word, SIMPLIFICATION_FORMS)]
+        if word.isupper():
+            return upper
+        elif word[0].isupper():
+            return capitalized
+        return lower
+    
+    return SIMPLIFICATION_PATTERN.subn(replace_case, text)
 
 
 def shorten_sentences(text: str, max_words: int = 25) -> Tuple[str, int]:
@@ -161,14 +226,16 @@ def shorten_sentences(text: str, max_words: int = 25) -> Tuple[str, int]:
     
     Returns modified text and count of sentences split.
     """
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = SENTENCE_SPLIT_PATTERN.split(text)
     new_sentences = []
     changes = 0
     
+    # Every word but the last needs a separator, so more than max_words
+    # words take at least this many characters
+    min_long_length = 2 * max_words + 1
+    
     for sentence in sentences:
-        words = sentence.split()
-        
-        if len(words) > max_words:
+        if len(sentence) >= min_long_length and len(sentence.split()) > max_words:
             # Try to find a good breaking point
             split_points = find_split_points(sentence)
             
@@ -186,7 +253,7 @@ def shorten_sentences(text: str, max_words: int = 25) -> Tuple[str, int]:
                 # Capitalize second part
                 if second_part:
                     # Remove leading conjunctions
-                    second_part = re.sub(r'^(and|but|or|so|yet)\s+', '', second_part, flags=re.IGNORECASE)
+                    second_part = LEADING_CONJUNCTION_PATTERN.sub('', second_part)
                     second_part = second_part[0].upper() + second_part[1:] if second_part else ''
                 
                 new_sentences.append(first_part)
@@ -207,28 +274,18 @@ def find_split_points(sentence: str) -> List[int]:
     
     Looks for conjunctions, semicolons, and natural breaks.
     """
-    split_markers = [
-        ('; ', 0),           # Semicolons are great split points
-        (', and ', 1),       # Comma + conjunction
-        (', but ', 1),
-        (', or ', 1),
-        (', which ', 2),     # Relative clauses
-        (', that ', 2),
-        (' because ', 3),    # Causal
-        (' while ', 3),
-        (' although ', 3),
-    ]
+    sentence_lower = sentence.lower()
     
     points = []
-    for marker, priority in split_markers:
-        idx = sentence.lower().find(marker)
+    for marker, priority in SPLIT_MARKERS:
+        idx = sentence_lower.find(marker)
         if idx > 10:  # Ensure first part isn't too short
-            points.append((idx + len(marker) - 1, priority))
+            points.append((priority, idx + len(marker) - 1))
     
-    # Sort by position, preferring earlier splits
-    points.sort(key=lambda x: (x[1], x[0]))
+    # Sort by priority, preferring earlier splits
+    points.sort()
     
-    return [p[0] for p in points]
+    return [p[1] for p in points]
 
 
 def remove_redundancy(text: str) -> Tuple[str, int]:
@@ -237,33 +294,9 @@ def remove_redundancy(text: str) -> Tuple[str, int]:
     
     Returns cleaned text and count of removals.
     """
-    redundant_phrases = [
-        (r'\bin order to\b', 'to'),
-        (r'\bdue to the fact that\b', 'because'),
-        (r'\bat this point in time\b', 'now'),
-        (r'\bin the event that\b', 'if'),
-        (r'\bfor the purpose of\b', 'for'),
-        (r'\bwith regard to\b', 'about'),
-        (r'\bin spite of the fact that\b', 'although'),
-        (r'\bas a matter of fact\b', ''),
-        (r'\bit is important to note that\b', ''),
-        (r'\bit should be noted that\b', ''),
-        (r'\bbasically\b', ''),
-        (r'\bactually\b', ''),
-        (r'\bgenerally speaking\b', ''),
-        (r'\bfor all intents and purposes\b', ''),
-    ]
-    
-    result = text
-    changes = 0
-    
-    for pattern, replacement in redundant_phrases:
-        matches = re.findall(pattern, result, re.IGNORECASE)
-        if matches:
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-            changes += len(matches)
-    
-    return result, changes
+    return REDUNDANCY_PATTERN.subn(
+        lambda match: REDUNDANT_PHRASES[_table_key(match.group(0), REDUNDANT_PHRASES)], text
+    )
 
 
 def clean_text(text: str) -> str:
@@ -271,39 +304,42 @@ def clean_text(text: str) -> str:
     Clean up text after simplifications.
     """
     # Remove double spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = ' '.join(text.split())
     
-    # Fix punctuation spacing
-    text = re.sub(r'\s+([.,!?;:])', r'\1', text)
+    # Fix punctuation spacing (only single spaces are left)
+    for mark in '.,!?;:':
+        text = text.replace(' ' + mark, mark)
     
-    # Remove empty sentences
-    text = re.sub(r'\.\s*\.', '.', text)
+    # Remove empty sentences (no space can precede a period any more)
+    text = text.replace('..', '.')
     
     # Ensure proper capitalization after periods
-    text = re.sub(r'([.!?])\s+([a-z])', lambda m: m.group(1) + ' ' + m.group(2).upper(), text)
+    text = LOWERCASE_START_PATTERN.sub(lambda m: m.group(1) + ' ' + m.group(2).upper(), text)
     
     return text.strip()
 
 
-def calculate_readability(text: str) -> Dict[str, float]:
+def calculate_readability(text: str, include_flesch: bool = True) -> Dict[str, float]:
     """
     Calculate readability metrics.
     
     Includes average word length, sentence length, and Flesch score.
+    With include_flesch=False the syllable count and Flesch score are
+    skipped and only the two averages are returned.
     """
     if not text:
-        return {
+        metrics = {
             'avg_word_length': 0,
-            'avg_sentence_length': 0,
-            'flesch_score': 0
+            'avg_sentence_length': 0
         }
+        if include_flesch:
+            metrics['flesch_score'] = 0
+        return metrics
     
     words = text.split()
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s for s in sentences if s.strip()]
     
     word_count = len(words)
-    sentence_count = len(sentences) or 1
+    sentence_count = sum(1 for s in SENTENCE_END_PATTERN.split(text) if s.strip()) or 1
     
     # Average word length
     total_chars = sum(len(word.strip('.,!?;:')) for word in words)
@@ -312,6 +348,12 @@ def calculate_readability(text: str) -> Dict[str, float]:
     # Average sentence length
     avg_sentence_length = word_count / sentence_count
     
+    if not include_flesch:
+        return {
+            'avg_word_length': avg_word_length,
+            'avg_sentence_length': avg_sentence_length
+        }
+    
     # Simplified Flesch Reading Ease (approximation)
     # Higher score = easier to read
     syllable_count = estimate_syllables(text)
@@ -331,22 +373,20 @@ def estimate_syllables(text: str) -> int:
     """
     Estimate syllable count in text.
     
-    Uses a simple vowel-counting heuristic.
+    Uses a simple vowel-counting heuristic: one syllable per vowel group,
+    minus one for a silent final e, with at least one per word. Each part
+    is counted over the whole text at once rather than word by word.
     """
     text = text.lower()
-    words = re.findall(r'[a-z]+', text)
     
-    total = 0
-    for word in words:
-        # Count vowel groups
-        syllables = len(re.findall(r'[aeiouy]+', word))
-        
-        # Adjust for silent e
-        if word.endswith('e') and syllables > 1:
-            syllables -= 1
-        
-        # Minimum 1 syllable per word
-        total += max(syllables, 1)
+    # Count vowel groups (non-ASCII characters become '?' and then blanks)
+    total = len(text.encode('ascii', 'replace').translate(VOWEL_TABLE).split())
+    
+    # Minimum 1 syllable per word
+    total += len(NO_VOWEL_WORD_PATTERN.findall(text))
+    
+    # Adjust for silent e
+    total -= len(SILENT_E_PATTERN.findall(text))
     
     return total
 
@@ -11,10 +11,24 @@ Strategy:
 4. Calculate coverage and accuracy metrics
 """
 
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, FrozenSet, Optional, Tuple
 import re
 
 
+WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Common words excluded from significant terms
+STOP_WORDS: FrozenSet[str] = frozenset({
+    'the', 'and', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'must', 'can', 'this', 'that', 'these', 'those', 'with', 'from',
+    'for', 'into', 'through', 'during', 'before', 'after', 'above', 'below',
+    'between', 'under', 'again', 'here', 'there', 'when', 'where', 'which',
+    'while', 'about', 'against', 'each', 'other', 'such', 'more', 'some',
+    'than', 'very', 'just', 'also', 'only', 'over', 'your', 'their', 'what'
+})
+
 def run(processed_input: Dict[str, Any],
         encoding: Dict[str, Any],
         reasoning_result: Dict[str, Any],
@@ -42,14 +56,22 @@ def run(processed_input: Dict[str, Any],
             "confidence": 0.0
         }
     
+    # Lowercase both texts once; every check below works on these.
+    # The shared encoder has already indexed the original.
+    text_index = encoding.get('text_index', {})
+    original_lower = text_index.get('text_lower') or original_text.lower()
+    summary_lower = summary.lower()
+    
     # Step 1: Extract significant claims/terms from summary
-    summary_terms = extract_significant_terms(summary)
+    summary_terms = extract_significant_terms(summary_lower)
     
     # Step 2: Verify terms against original
-    verification = verify_terms(summary_terms, original_text)
+    verification = verify_terms(summary_terms, original_lower,
+                                text_index.get('word_set'))
     
     # Step 3: Check sentence-level claims
-    sentence_verification = verify_sentences(summary, original_text)
+    sentence_verification = verify_sentences(summary_lower, original_lower,
+                                             text_index.get('trigram_set'))
     
     # Step 4: Calculate metrics
     coverage = verification['matched'] / max(verification['total'], 1)
@@ -77,75 +99,70 @@ def run(processed_input: Dict[str, Any],
     }
 
 
-def extract_significant_terms(text: str, min_length: int = 4) -> List[str]:
+def extract_significant_terms(text_lower: str, min_length: int = 4) -> List[str]:
     """
-    Extract significant terms from text.
+    Extract significant terms from lowercased text.
     
     Filters out common words and short terms.
     """
-    # Common words to exclude
-    stop_words = {
-        'the', 'and', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has',
-        'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
-        'might', 'must', 'can', 'this', 'that', 'these', 'those', 'with', 'from',
-        'for', 'into', 'through', 'during', 'before', 'after', 'above', 'below',
-        'between', 'under', 'again', 'here', 'there', 'when', 'where', 'which',
-        'while', 'about', 'against', 'each', 'other', 'such', 'more', 'some',
-        'than', 'very', 'just', 'also', 'only', 'over', 'your', 'their', 'what'
-    }
-    
     # Extract words
-    words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+    words = WORD_PATTERN.findall(text_lower)
     
-    # Filter significant terms
-    significant = [
+    # Filter significant terms, removing duplicates while preserving order
+    return list(dict.fromkeys(
         word for word in words
-        if len(word) >= min_length and word not in stop_words
-    ]
-    
-    # Remove duplicates while preserving order
-    seen: Set[str] = set()
-    unique = []
-    for term in significant:
-        if term not in seen:
-            seen.add(term)
-            unique.append(term)
-    
-    return unique
+        if len(word) >= min_length and word not in STOP_WORDS
+    ))
 
 
-def verify_terms(terms: List[str], original: str) -> Dict[str, Any]:
+def verify_terms(terms: List[str], original_lower: str,
+                 original_words: Optional[FrozenSet[str]] = None) -> Dict[str, Any]:
     """
-    Verify terms exist in original text.
+    Verify terms exist in the lowercased original text.
+    
+    original_words is a set of lowercased words of the original (the
+    shared encoder's word_set), built here when not passed in.
     
     Returns counts of matched and unmatched terms.
     """
-    original_lower = original.lower()
-    matched = []
+    matched = 0
     unmatched = []
     
+    # Terms are whole words, so most are found by a lookup in the
+    # original's words; only the rest need a substring scan
+    if original_words is None:
+        original_words = frozenset(WORD_PATTERN.findall(original_lower))
+    
     for term in terms:
-        if term in original_lower:
-            matched.append(term)
-        else:
+        if term in original_words or term in original_lower:
+            matched += 1
+        elif len(unmatched) < 5:  # Limit for readability
             unmatched.append(term)
     
     return {
-        "matched": len(matched),
-        "unmatched": unmatched[:5],  # Limit for readability
+        "matched": matched,
+        "unmatched": unmatched,
         "total": len(terms)
     }
 
 
-def verify_sentences(summary: str, original: str) -> Dict[str, Any]:
+def verify_sentences(summary_lower: str, original_lower: str,
+                     original_trigrams: Optional[FrozenSet[Tuple[str, str, str]]] = None) -> Dict[str, Any]:
     """
-    Verify sentences in summary against original text.
+    Verify sentences in summary against original text (both lowercased).
     
     Checks if key phrases from summary sentences appear in original.
+    original_trigrams is the set of 3-word sequences of the lowercased
+    original (the shared encoder's trigram_set), built here when not
+    passed in.
     """
     # Split summary into sentences
-    summary_sentences = re.split(r'(?<=[.!?])\s+', summary)
-    original_lower = original.lower()
+    summary_sentences = SENTENCE_SPLIT_PATTERN.split(summary_lower)
+    
+    # Index every 3-word sequence of the original once
+    if original_trigrams is None:
+        original_words = original_lower.split()
+        original_trigrams = frozenset(zip(original_words, original_words[1:], original_words[2:]))
     
     verified_count = 0
     total_count = len(summary_sentences)
@@ -156,20 +173,20 @@ def verify_sentences(summary: str, original: str) -> Dict[str, Any]:
             continue
             
         # Extract key phrases (3+ word sequences)
-        words = sentence.lower().split()
+        words = sentence.split()
         if len(words) < 3:
             # Very short sentence - check whole thing
-            if sentence.lower().strip('.,!?') in original_lower:
+            if sentence.strip('.,!?') in original_lower:
                 verified_count += 1
             continue
         
-        # Check for phrase matches
-        verified = False
-        for i in range(len(words) - 2):
-            phrase = ' '.join(words[i:i+3])
-            if phrase in original_lower:
-                verified = True
-                break
+        # Check for phrase matches: whole-word trigrams by lookup, then
+        # substrings (a phrase may start or end mid-word in the original)
+        trigrams = list(zip(words, words[1:], words[2:]))
+        verified = (
+            any(trigram in original_trigrams for trigram in trigrams) or
+            any(' '.join(trigram) in original_lower for trigram in trigrams)
+        )
         
         if verified:
             verified_count += 1
@@ -14,7 +14,7 @@ The key insight: Instead of "first output wins", each agent
 submits its version and outputs are scored locally.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 
 def debate(agent_results: Dict[str, Dict[str, Any]], 
@@ -52,17 +52,15 @@ def debate(agent_results: Dict[str, Dict[str, Any]],
     critique_issues = critique.get('issues', [])
     critique_quality = critique.get('quality', 'Unknown')
     
-    # Adjust scores based on critique
-    adjusted_candidates = apply_critique_adjustments(
+    # Adjust scores based on critique (Round 3, the winner, comes out
+    # of the same pass)
+    adjusted_candidates, winner = apply_critique_adjustments(
         candidates, 
         critique_issues,
         verification.get('verified', False),
         verification.get('coverage', 0)
     )
     
-    # Round 3: Determine winner
-    winner = select_winner(adjusted_candidates)
-    
     # Collect all insights for refinement
     debate_result = {
         'winner': winner,
@@ -87,59 +85,55 @@ def debate(agent_results: Dict[str, Dict[str, Any]],
 def apply_critique_adjustments(candidates: Dict[str, Dict[str, Any]],
                                critique_issues: List[str],
                                verified: bool,
-                               coverage: int) -> Dict[str, Dict[str, Any]]:
+                               coverage: int) -> Tuple[Dict[str, Dict[str, Any]], str]:
     """
     Adjust candidate scores based on critique and verification feedback.
     
     Verification passing gives a bonus.
     Critique issues give penalties.
+    
+    Returns the adjusted candidates and the winner, picked during the
+    same pass: the highest adjusted score among candidates with a
+    summary wins, and on a tie simplification is preferred for
+    readability. Without any summary, reasoning is reported.
     """
     adjusted = {}
+    best_name = None
+    best_score = -1
+    
+    # Verification bonus
+    if verified:
+        verification_bonus = 0.15
+    elif coverage > 70:
+        verification_bonus = 0.10
+    else:
+        verification_bonus = 0
+    
+    # Critique penalty
+    issue_penalty = min(len(critique_issues) * 0.05, 0.2)
     
     for name, candidate in candidates.items():
-        adjusted_score = candidate['score']
-        
-        # Verification bonus
-        if verified:
-            adjusted_score += 0.15
-        elif coverage > 70:
-            adjusted_score += 0.10
-        
-        # Critique penalty
-        issue_penalty = min(len(critique_issues) * 0.05, 0.2)
-        adjusted_score -= issue_penalty
+        adjusted_score = candidate['score'] + verification_bonus - issue_penalty
         
         # Prefer simplified version if scores are close and verification passed
         if name == 'simplification' and verified:
             adjusted_score += 0.05  # Slight preference for readability
         
+        score = round(max(0, min(1, adjusted_score)), 3)
         adjusted[name] = {
             'summary': candidate['summary'],
-            'score': round(max(0, min(1, adjusted_score)), 3),
+            'score': score,
             'confidence': candidate['confidence']
         }
-    
-    return adjusted
-
-
-def select_winner(candidates: Dict[str, Dict[str, Any]]) -> str:
-    """
-    Select the winning candidate based on adjusted scores.
-    
-    In case of tie, prefer simplification for readability.
-    """
-    best_name = None
-    best_score = -1
-    
-    for name, candidate in candidates.items():
-        if candidate['score'] > best_score:
-            best_score = candidate['score']
-            best_name = name
-        elif candidate['score'] == best_score and name == 'simplification':
-            # Prefer simplification on tie
+        
+        # An empty summary cannot win; prefer simplification on tie
+        if not candidate['summary']:
+            continue
+        if score > best_score or (score == best_score and name == 'simplification'):
+            best_score = score
             best_name = name
     
-    return best_name or 'reasoning'
+    return adjusted, best_name or 'reasoning'
 
 
 def get_consensus_elements(agent_results: Dict[str, Dict[str, Any]]) -> List[str]:
@@ -156,12 +150,14 @@ def get_consensus_elements(agent_results: Dict[str, Dict[str, Any]]) -> List[str
     
     # Find points also present in simplified version
     simplified_summary = simplification.get('summary', '').lower()
+    simplified_words = set(simplified_summary.split())
     
     consensus = []
     for point in key_points:
-        # Check if key words from point appear in simplified
+        # Check if key words from point appear in simplified (whole words
+        # by lookup, otherwise as a substring)
         words = [w for w in point.lower().split() if len(w) > 5]
-        matches = sum(1 for w in words if w in simplified_summary)
+        matches = sum(1 for w in words if w in simplified_words or w in simplified_summary)
         if matches >= len(words) * 0.5:  # At least 50% word match
             consensus.append(point)
     
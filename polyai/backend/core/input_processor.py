@@ -21,7 +21,22 @@ MAX_WORDS = 500
 # Noise patterns to remove
 URL_PATTERN = re.compile(r'https?://[^\s]+', re.IGNORECASE)
 EMAIL_PATTERN = re.compile(r'[\w.-]+@[\w.-]+\.\w+', re.IGNORECASE)
-SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s.,!?;:\'"()-]')
+
+# Runs of special characters and whitespace, each collapsed to one space.
+# Covers both cleanup steps in a single pass: special characters become
+# spaces and whitespace is then normalized.
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w.,!?;:\'"()-]+')
+
+# Common abbreviations whose period does not end a sentence
+ABBREVIATIONS: List[str] = ['Mr.', 'Mrs.', 'Dr.', 'Prof.', 'Sr.', 'Jr.', 'vs.', 'etc.', 'e.g.', 'i.e.']
+
+# Whitespace after sentence-ending punctuation, unless it closes an abbreviation
+SENTENCE_SPLIT_PATTERN = re.compile(
+    r'(?<=[.!?])' + ''.join(f'(?<!{re.escape(abbr)})' for abbr in ABBREVIATIONS) + r'\s+'
+)
+
+# Sentence index for each fixed position indicator ('middle' depends on length)
+POSITION_INDICES: Dict[str, int] = {'first': 0, 'last': -1}
 
 
 def process(text: str) -> Dict[str, Any]:
@@ -35,8 +50,10 @@ def process(text: str) -> Dict[str, Any]:
         Dictionary containing:
         - original: Original text
         - normalized: Cleaned text
+        - normalized_lower: Lowercased cleaned text
         - sentences: List of sentences
         - words: List of words
+        - sentence_words: Lowercased words of each sentence
         - word_count: Total word count
         - truncated: Whether text was trimmed
     """
@@ -44,52 +61,72 @@ def process(text: str) -> Dict[str, Any]:
         return {
             "original": "",
             "normalized": "",
+            "normalized_lower": "",
             "sentences": [],
             "words": [],
+            "sentence_words": [],
             "word_count": 0,
             "truncated": False
         }
     
     original = text.strip()
-    processed = text
-    
-    # Step 1: Remove URLs
-    processed = URL_PATTERN.sub('', processed)
-    
-    # Step 2: Remove email addresses
-    processed = EMAIL_PATTERN.sub('', processed)
-    
-    # Step 3: Remove special characters (keep basic punctuation)
-    processed = SPECIAL_CHARS_PATTERN.sub(' ', processed)
-    
-    # Step 4: Normalize whitespace
-    processed = re.sub(r'\s+', ' ', processed).strip()
-    
-    # Step 5: Sentence segmentation
-    sentences = segment_sentences(processed)
-    
-    # Step 6: Word tokenization
-    words = processed.lower().split()
     
-    # Step 7: Truncate if too long
+    # Steps 1-4: Remove noise. Very long inputs are first cleaned from a
+    # bounded prefix of raw tokens; the full text is only cleaned when that
+    # prefix does not already yield more than MAX_WORDS words.
+    processed = None
+    limit = MAX_WORDS * 2
+    parts = text.split(None, limit)
+    if len(parts) > limit:
+        processed = remove_noise(' '.join(parts[:limit]))
+        if processed.count(' ') < MAX_WORDS:
+            processed = None
+    if processed is None:
+        processed = remove_noise(text)
+    
+    # Step 5: Word tokenization
+    processed_lower = processed.lower()
+    words = processed_lower.split()
+    
+    # Step 6: Truncate if too long
     truncated = False
     if len(words) > MAX_WORDS:
         words = words[:MAX_WORDS]
         truncated = True
         # Rebuild processed text from truncated words
-        processed = ' '.join(words)
-        sentences = segment_sentences(processed)
+        processed = processed_lower = ' '.join(words)
+    
+    # Step 7: Sentence segmentation
+    sentences = segment_sentences(processed)
+    
+    # Step 8: Tokenize each sentence once for all downstream consumers
+    sentence_words = [s.lower().split() for s in sentences]
     
     return {
         "original": original,
         "normalized": processed,
+        "normalized_lower": processed_lower,
         "sentences": sentences,
         "words": words,
+        "sentence_words": sentence_words,
         "word_count": len(words),
         "truncated": truncated
     }
 
 
+def remove_noise(text: str) -> str:
+    """Strip URLs, emails and special characters, and normalize whitespace."""
+    # Step 1: Remove URLs
+    text = URL_PATTERN.sub('', text)
+    
+    # Step 2: Remove email addresses
+    text = EMAIL_PATTERN.sub('', text)
+    
+    # Steps 3-4: Remove special characters (keep basic punctuation) and
+    # normalize whitespace
+    return SPECIAL_CHARS_PATTERN.sub(' ', text).strip()
+
+
 def segment_sentences(text: str) -> List[str]:
     """
     Split text into sentences.
@@ -100,25 +137,11 @@ def segment_sentences(text: str) -> List[str]:
     if not text:
         return []
     
-    # Common abbreviations to preserve
-    abbreviations = ['Mr.', 'Mrs.', 'Dr.', 'Prof.', 'Sr.', 'Jr.', 'vs.', 'etc.', 'e.g.', 'i.e.']
+    # Split on sentence boundaries (abbreviations are skipped by the pattern)
+    raw_sentences = SENTENCE_SPLIT_PATTERN.split(text)
     
-    # Temporarily replace abbreviations
-    temp_text = text
-    placeholders = {}
-    for i, abbr in enumerate(abbreviations):
-        placeholder = f'__ABBR{i}__'
-        placeholders[placeholder] = abbr
-        temp_text = temp_text.replace(abbr, placeholder)
-    
-    # Split on sentence boundaries
-    raw_sentences = re.split(r'(?<=[.!?])\s+', temp_text)
-    
-    # Restore abbreviations
     sentences = []
     for s in raw_sentences:
-        for placeholder, abbr in placeholders.items():
-            s = s.replace(placeholder, abbr)
         s = s.strip()
         if s and len(s) > 5:  # Skip very short fragments
             sentences.append(s)
@@ -147,16 +170,10 @@ def get_sentences_by_position(sentences: List[str], positions: List[str]) -> Lis
     if not sentences:
         return []
     
-    selected = []
+    # Resolve positions to indices once; a middle needs at least 3 sentences
+    indices = dict(POSITION_INDICES)
     n = len(sentences)
+    if n > 2:
+        indices['middle'] = n // 2
     
-    for pos in positions:
-        if pos == 'first' and n > 0:
-            selected.append(sentences[0])
-        elif pos == 'last' and n > 0:
-            selected.append(sentences[-1])
-        elif pos == 'middle' and n > 2:
-            mid_idx = n // 2
-            selected.append(sentences[mid_idx])
-    
-    return selected
+    return [sentences[indices[pos]] for pos in positions if pos in indices]
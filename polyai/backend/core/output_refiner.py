@@ -15,8 +15,48 @@ Refinement Steps:
 """
 
 from typing import Dict, Any, List
+from collections import Counter
 import re
 
+from .text_tables import PUNCT_TABLE
+
+
+# Critique ratings that need no further refinement
+GOOD_QUALITY = ('Good', 'Excellent')
+
+# Only punctuation that needs fixing: a letter directly after it, or a
+# lowercase letter starting a sentence
+PUNCT_FIX_PATTERN = re.compile(r'[.,!?;:][A-Za-z]|[.!?] [a-z]')
+LEADING_PUNCT_PATTERN = re.compile(r'^[.,;:\s]+')
+TRAILING_PUNCT_PATTERN = re.compile(r'[,;:\s]+$')
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Phrases a long sentence can be broken after, in order of preference
+BREAK_MARKERS = (
+    '; ',           # Semicolon
+    ', and ',       # Compound
+    ', but ',
+    ', which ',     # Relative clause
+    ' because ',    # Causal
+    ' although ',
+    ' however ',
+)
+
+# Simple synonym substitutions for common repeated words
+SYNONYMS: Dict[str, List[str]] = {
+    'important': ['significant', 'key', 'essential', 'crucial'],
+    'shows': ['demonstrates', 'indicates', 'reveals'],
+    'because': ['since', 'as', 'given that'],
+    'however': ['nevertheless', 'yet', 'still'],
+    'therefore': ['thus', 'hence', 'consequently'],
+    'also': ['additionally', 'moreover', 'furthermore'],
+}
+
+# Whole-word, case-insensitive pattern for each word with synonyms
+SYNONYM_PATTERNS = {
+    word: re.compile(r'\b' + word + r'\b', re.IGNORECASE) for word in SYNONYMS
+}
+
 
 def refine(debate_result: Dict[str, Any], 
            agent_results: Dict[str, Dict[str, Any]]) -> str:
@@ -40,14 +80,19 @@ def refine(debate_result: Dict[str, Any],
     if not winning_summary:
         return "Unable to generate summary."
     
-    # Step 1: Resolve any conflicts flagged  
-    refined = resolve_conflicts(winning_summary, debate_result)
+    refined = winning_summary
     
-    # Step 2: Apply beneficial critique suggestions
-    refined = apply_suggestions(refined, debate_result)
-    
-    # Step 3: Ensure verified content preference
-    refined = prioritize_verified(refined, agent_results.get('verification', {}))
+    # Steps 1-3 only act on flagged issues or weak critique quality, so
+    # a clean, well-rated winner goes straight to polishing
+    if has_issues(debate_result):
+        # Step 1: Resolve any conflicts flagged  
+        refined = resolve_conflicts(refined, debate_result)
+        
+        # Step 2: Apply beneficial critique suggestions
+        refined = apply_suggestions(refined, debate_result)
+        
+        # Step 3: Ensure verified content preference
+        refined = prioritize_verified(refined, agent_results.get('verification', {}))
     
     # Step 4: Polish text
     refined = polish_text(refined)
@@ -58,6 +103,14 @@ def refine(debate_result: Dict[str, Any],
     return refined
 
 
+def has_issues(debate_result: Dict[str, Any]) -> bool:
+    """Whether verification or critique flagged anything worth refining."""
+    if debate_result.get('verification_status', {}).get('issues'):
+        return True
+    quality = debate_result.get('critique_feedback', {}).get('quality', 'Unknown')
+    return quality not in GOOD_QUALITY
+
+
 def resolve_conflicts(summary: str, debate_result: Dict[str, Any]) -> str:
     """
     Resolve any conflicts identified during debate.
@@ -88,7 +141,7 @@ def apply_suggestions(summary: str, debate_result: Dict[str, Any]) -> str:
     quality = critique_feedback.get('quality', 'Unknown')
     
     # If quality is good or excellent, no changes needed
-    if quality in ['Good', 'Excellent']:
+    if quality in GOOD_QUALITY:
         return result
     
     # For fair or lower quality, apply some improvements
@@ -150,21 +203,16 @@ def polish_text(text: str) -> str:
     if not text:
         return text
     
-    result = text
-    
     # Fix double spaces
-    result = re.sub(r'\s+', ' ', result)
+    result = ' '.join(text.split())
     
-    # Fix punctuation spacing
-    result = re.sub(r'\s+([.,!?;:])', r'\1', result)
-    result = re.sub(r'([.,!?;:])([A-Za-z])', r'\1 \2', result)
+    # Fix punctuation spacing (only single spaces are left)
+    for mark in '.,!?;:':
+        result = result.replace(' ' + mark, mark)
     
-    # Ensure proper capitalization after sentence endings
-    result = re.sub(
-        r'([.!?])\s+([a-z])', 
-        lambda m: m.group(1) + ' ' + m.group(2).upper(), 
-        result
-    )
+    # Put one space between punctuation and the next word, capitalizing
+    # it after sentence endings (a single pass for both fixes)
+    result = PUNCT_FIX_PATTERN.sub(fix_punctuation, result)
     
     # Capitalize first letter
     if result:
@@ -177,6 +225,18 @@ def polish_text(text: str) -> str:
     return result
 
 
+def fix_punctuation(match: re.Match) -> str:
+    """Replacement for a PUNCT_FIX_PATTERN match."""
+    fragment = match.group(0)
+    
+    # Already spaced: only the capital is missing
+    if len(fragment) == 3:
+        return fragment.upper()
+    
+    mark, letter = fragment
+    return mark + ' ' + (letter.upper() if mark in '.!?' else letter)
+
+
 def final_check(text: str) -> str:
     """
     Final quality check before returning.
@@ -196,8 +256,8 @@ def final_check(text: str) -> str:
         result += '.'
     
     # Remove any hanging punctuation
-    result = re.sub(r'^[.,;:\s]+', '', result)
-    result = re.sub(r'[,;:\s]+$', '.', result)
+    result = LEADING_PUNCT_PATTERN.sub('', result)
+    result = TRAILING_PUNCT_PATTERN.sub('.', result)
     result = result.replace('..', '.')
     
     # Ensure minimum length (at least should be a real sentence)
@@ -211,10 +271,16 @@ def break_long_sentences(text: str, max_words: int = 35) -> str:
     """
     Break overly long sentences into shorter ones.
     """
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = SENTENCE_SPLIT_PATTERN.split(text)
     new_sentences = []
     
     for sentence in sentences:
+        # Count spaces rather than building a word list: when a space is
+        # the only whitespace (printable text), words are at most spaces + 1
+        if sentence.count(' ') < max_words and sentence.isprintable():
+            new_sentences.append(sentence)
+            continue
+        
         words = sentence.split()
         
         if len(words) > max_words:
@@ -247,22 +313,16 @@ def find_break_point(sentence: str) -> int:
     """
     Find the best point to break a long sentence.
     """
-    markers = [
-        '; ',           # Semicolon
-        ', and ',       # Compound
-        ', but ',
-        ', which ',     # Relative clause
-        ' because ',    # Causal
-        ' although ',
-        ' however ',
-    ]
-    
     best_point = None
     best_position = float('inf')
     
-    for marker in markers:
-        idx = sentence.lower().find(marker)
-        if idx > 15 and idx < len(sentence) - 15:
+    # Lowercase once for all markers
+    sentence_lower = sentence.lower()
+    max_idx = len(sentence) - 15
+    
+    for marker in BREAK_MARKERS:
+        idx = sentence_lower.find(marker)
+        if idx > 15 and idx < max_idx:
             if idx < best_position:
                 best_position = idx + len(marker)
                 best_point = best_position
@@ -276,42 +336,27 @@ def reduce_repetition(text: str) -> str:
     
     Uses simple substitution for commonly repeated words.
     """
-    words = text.split()
-    word_count = {}
-    
-    # Count word occurrences
-    for word in words:
-        clean = word.lower().strip('.,!?;:')
-        if len(clean) > 4:
-            word_count[clean] = word_count.get(clean, 0) + 1
+    # Count occurrences of the words we have synonyms for
+    cleaned = text.lower().translate(PUNCT_TABLE).split()
+    word_count = Counter(w for w in cleaned if len(w) > 4 and w in SYNONYMS)
     
     # Find overly repeated words
     repeated = [w for w, c in word_count.items() if c > 3]
-    
-    # Simple synonym substitutions for common repeated words
-    substitutions = {
-        'important': ['significant', 'key', 'essential', 'crucial'],
-        'shows': ['demonstrates', 'indicates', 'reveals'],
-        'because': ['since', 'as', 'given that'],
-        'however': ['nevertheless', 'yet', 'still'],
-        'therefore': ['thus', 'hence', 'consequently'],
-        'also': ['additionally', 'moreover', 'furthermore'],
-    }
+    if not repeated:
+        return text
     
     result = text
     for word in repeated:
-        if word in substitutions:
-            # Replace some occurrences
-            alts = substitutions[word]
-            pattern = r'\b' + word + r'\b'
-            count = 0
-            def replacer(match):
-                nonlocal count
-                count += 1
-                if count > 1 and count % 2 == 0:
-                    return alts[(count // 2 - 1) % len(alts)]
-                return match.group(0)
-            result = re.sub(pattern, replacer, result, flags=re.IGNORECASE)
+        # Replace some occurrences
+        alts = SYNONYMS[word]
+        count = 0
+        def replacer(match):
+            nonlocal count
+            count += 1
+            if count > 1 and count % 2 == 0:
+                return alts[(count // 2 - 1) % len(alts)]
+            return match.group(0)
+        result = SYNONYM_PATTERNS[word].sub(replacer, result)
     
     return result
 
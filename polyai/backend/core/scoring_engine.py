@@ -12,9 +12,40 @@ Scoring Criteria:
 5. Accuracy: Claims verifiable against source
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, FrozenSet, Optional, Tuple
+from functools import lru_cache
 import re
 
+from .text_tables import PUNCT_TABLE, VOWEL_TABLE
+
+
+# Common words ignored when measuring coverage
+COVERAGE_STOP_WORDS: FrozenSet[str] = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'have', 'has', 'had', 'do', 'does', 'did', 'and', 'or', 'but',
+    'in', 'on', 'at', 'to', 'for', 'of', 'with', 'as', 'by', 'this',
+    'that', 'it', 'its', 'from', 'their', 'they', 'them', 'we', 'our'
+})
+
+# Sub-scores are passed around as plain tuples in this fixed order
+SCORE_DIMENSIONS = ('coverage', 'brevity', 'clarity', 'consistency', 'structure')
+SubScores = Tuple[float, float, float, float, float]
+
+# Sub-score weights, in SCORE_DIMENSIONS order
+DEFAULT_WEIGHTS = (0.30, 0.20, 0.20, 0.15, 0.15)
+SIMPLIFIED_WEIGHTS = (0.25, 0.20, 0.30, 0.15, 0.15)
+
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+SENTENCE_BREAK_PATTERN = re.compile(r'[.!?]\s+')
+FINAL_PUNCT_PATTERN = re.compile(r'[.!?]$')
+
+# Syllables are estimated over whitespace-separated words of lowercased
+# text; words without any vowel group still count as one syllable each
+NO_VOWEL_WORD_PATTERN = re.compile(r'(?<!\S)[^\saeiouy]+(?!\S)')
+
+# Words ending in a silent e: a final e group preceded by another vowel group
+SILENT_E_PATTERN = re.compile(r'[aeiouy][^\saeiouy]+[aeiouy]*e(?!\S)')
+
 
 def score_all(agent_results: Dict[str, Dict[str, Any]], 
               processed_input: Dict[str, Any]) -> Dict[str, float]:
@@ -35,12 +66,17 @@ def score_all(agent_results: Dict[str, Dict[str, Any]],
     simplification = agent_results.get('simplification', {})
     critique = agent_results.get('critique', {})
     
+    # Sub-scores depend only on the summary text, so a summary returned
+    # by both agents is scored once
+    components: Dict[str, SubScores] = {}
+    
     # Score reasoning agent output
     if reasoning.get('summary'):
         scores['reasoning'] = score_summary(
             reasoning.get('summary', ''),
             processed_input,
-            reasoning.get('confidence', 0)
+            reasoning.get('confidence', 0),
+            components=components
         )
     else:
         scores['reasoning'] = 0.0
@@ -51,7 +87,8 @@ def score_all(agent_results: Dict[str, Dict[str, Any]],
             simplification.get('summary', ''),
             processed_input,
             simplification.get('confidence', 0),
-            is_simplified=True
+            is_simplified=True,
+            components=components
         )
     else:
         scores['simplification'] = 0.0
@@ -67,15 +104,50 @@ def score_all(agent_results: Dict[str, Dict[str, Any]],
 def score_summary(summary: str, 
                   processed_input: Dict[str, Any],
                   agent_confidence: float,
-                  is_simplified: bool = False) -> float:
+                  is_simplified: bool = False,
+                  components: Optional[Dict[str, SubScores]] = None) -> float:
     """
     Score a summary on multiple quality dimensions.
     
+    Sub-scores are looked up in and added to components when given.
+    
     Returns overall score from 0 to 1.
     """
     if not summary:
         return 0.0
     
+    if components is None:
+        components = {}
+    if summary not in components:
+        components[summary] = score_components(summary, processed_input)
+    
+    # Weighted combination (simplified version weighs clarity higher)
+    w_coverage, w_brevity, w_clarity, w_consistency, w_structure = (
+        SIMPLIFIED_WEIGHTS if is_simplified else DEFAULT_WEIGHTS
+    )
+    coverage, brevity, clarity, consistency, structure = components[summary]
+    
+    total_score = (
+        w_coverage * coverage +
+        w_brevity * brevity +
+        w_clarity * clarity +
+        w_consistency * consistency +
+        w_structure * structure
+    )
+    
+    # Blend with agent's own confidence
+    blended_score = 0.7 * total_score + 0.3 * agent_confidence
+    
+    return round(blended_score, 3)
+
+
+def score_components(summary: str,
+                     processed_input: Dict[str, Any]) -> SubScores:
+    """
+    Score a summary on each quality dimension.
+    
+    Returns sub-scores in SCORE_DIMENSIONS order.
+    """
     original = processed_input.get('normalized', '')
     original_words = processed_input.get('word_count', 0)
     
@@ -85,41 +157,20 @@ def score_summary(summary: str,
     # 2. Brevity Score (0-1)
     brevity = score_brevity(summary, original_words)
     
+    # Lowercase and split sentences once for the clarity and consistency checks
+    summary_lower = summary.lower()
+    sentences = split_sentences(summary_lower)
+    
     # 3. Clarity Score (0-1)
-    clarity = score_clarity(summary)
+    clarity = score_clarity(summary, sentences, summary_lower)
     
     # 4. Consistency Score (0-1)
-    consistency = score_consistency(summary)
+    consistency = score_consistency(summary, sentences)
     
     # 5. Structure Score (0-1)
     structure = score_structure(summary)
     
-    # Weighted combination
-    weights = {
-        'coverage': 0.30,
-        'brevity': 0.20,
-        'clarity': 0.20,
-        'consistency': 0.15,
-        'structure': 0.15
-    }
-    
-    # Adjust weights for simplified version
-    if is_simplified:
-        weights['clarity'] = 0.30  # Higher weight on clarity
-        weights['coverage'] = 0.25
-    
-    total_score = (
-        weights['coverage'] * coverage +
-        weights['brevity'] * brevity +
-        weights['clarity'] * clarity +
-        weights['consistency'] * consistency +
-        weights['structure'] * structure
-    )
-    
-    # Blend with agent's own confidence
-    blended_score = 0.7 * total_score + 0.3 * agent_confidence
-    
-    return round(blended_score, 3)
+    return coverage, brevity, clarity, consistency, structure
 
 
 def score_coverage(summary: str, original: str) -> float:
@@ -131,19 +182,10 @@ def score_coverage(summary: str, original: str) -> float:
     if not original or not summary:
         return 0.0
     
-    # Extract significant words from original
-    stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-                  'have', 'has', 'had', 'do', 'does', 'did', 'and', 'or', 'but',
-                  'in', 'on', 'at', 'to', 'for', 'of', 'with', 'as', 'by', 'this',
-                  'that', 'it', 'its', 'from', 'their', 'they', 'them', 'we', 'our'}
-    
-    original_words = set(w.lower().strip('.,!?;:') 
-                        for w in original.split() 
-                        if len(w) > 3 and w.lower() not in stop_words)
-    
-    summary_words = set(w.lower().strip('.,!?;:') 
-                        for w in summary.split() 
-                        if len(w) > 3 and w.lower() not in stop_words)
+    # Extract significant words from original (cached: every candidate
+    # summary is scored against the same original)
+    original_words = significant_words(original)
+    summary_words = significant_words(summary)
     
     if not original_words:
         return 0.5  # Neutral score if no significant words
@@ -165,6 +207,15 @@ def score_coverage(summary: str, original: str) -> float:
     return min(max(score, 0), 1)
 
 
+@lru_cache(maxsize=128)
+def significant_words(text: str) -> FrozenSet[str]:
+    """Lowercased words longer than 3 characters, excluding stop words."""
+    # Lowercase and remove punctuation from the whole text in one pass each
+    # rather than per word
+    return frozenset(w for w in text.lower().translate(PUNCT_TABLE).split() 
+                     if len(w) > 3 and w not in COVERAGE_STOP_WORDS)
+
+
 def score_brevity(summary: str, original_word_count: int) -> float:
     """
     Score how appropriately compressed the summary is.
@@ -193,7 +244,13 @@ def score_brevity(summary: str, original_word_count: int) -> float:
     return 0.5
 
 
-def score_clarity(summary: str) -> float:
+def split_sentences(summary: str) -> List[str]:
+    """Non-empty sentences of a summary, split on ending punctuation."""
+    return [s.strip() for s in SENTENCE_END_PATTERN.split(summary) if s.strip()]
+
+
+def score_clarity(summary: str, sentences: Optional[List[str]] = None,
+                  summary_lower: Optional[str] = None) -> float:
     """
     Score readability using simplified Flesch-Kincaid.
     
@@ -203,19 +260,15 @@ def score_clarity(summary: str) -> float:
         return 0.0
     
     words = summary.split()
-    sentences = [s for s in re.split(r'[.!?]+', summary) if s.strip()]
+    if sentences is None:
+        sentences = split_sentences(summary)
     
     word_count = len(words)
     sentence_count = len(sentences) or 1
     
-    # Estimate syllables
-    syllable_count = 0
-    for word in words:
-        syllables = len(re.findall(r'[aeiouy]+', word.lower()))
-        syllables = max(syllables, 1)
-        if word.lower().endswith('e') and syllables > 1:
-            syllables -= 1
-        syllable_count += syllables
+    if summary_lower is None:
+        summary_lower = summary.lower()
+    syllable_count = count_syllables(summary_lower)
     
     avg_sentence_length = word_count / sentence_count
     avg_syllables_per_word = syllable_count / max(word_count, 1)
@@ -229,37 +282,40 @@ def score_clarity(summary: str) -> float:
     return round(score, 3)
 
 
-def score_consistency(summary: str) -> float:
+@lru_cache(maxsize=256)
+def count_syllables(text_lower: str) -> int:
+    """
+    Estimate syllables in lowercased text.
+    
+    One per vowel group, at least one per word, minus one for a silent
+    final e. Each part is counted over the whole text at once rather than
+    word by word (cached: the same summary is often scored repeatedly).
+    """
+    return (
+        len(text_lower.encode('ascii', 'replace').translate(VOWEL_TABLE).split()) +
+        len(NO_VOWEL_WORD_PATTERN.findall(text_lower)) -
+        len(SILENT_E_PATTERN.findall(text_lower))
+    )
+
+
+def score_consistency(summary: str, sentences: Optional[List[str]] = None) -> float:
     """
     Score internal consistency (no contradictions).
     
-    Uses simple heuristics to detect potential inconsistencies.
+    Contradictions are not analysed yet, so any multi-sentence summary
+    is assumed consistent.
     """
     if not summary:
         return 0.0
     
-    sentences = [s.strip() for s in re.split(r'[.!?]+', summary) if s.strip()]
+    # Sentences are compared lowercased
+    if sentences is None:
+        sentences = split_sentences(summary.lower())
     
     if len(sentences) < 2:
         return 0.9  # Single sentence can't contradict itself
     
-    # Check for simple contradiction patterns
-    inconsistency_score = 0
-    
-    for i, s1 in enumerate(sentences):
-        s1_lower = s1.lower()
-        for s2 in sentences[i+1:]:
-            s2_lower = s2.lower()
-            
-            # Check for negation contradictions
-            # e.g., "X is important" vs "X is not important"
-            if 'not' in s2_lower and 'not' not in s1_lower:
-                # Extract main concept and check if negated
-                # This is a very rough heuristic
-                pass  # Skip complex analysis for now
-    
-    # For now, assume consistency unless obvious issues found
-    return 0.85 + (0.15 * (1 - inconsistency_score))
+    return 1.0
 
 
 def score_structure(summary: str) -> float:
@@ -281,14 +337,14 @@ def score_structure(summary: str) -> float:
         score -= 0.2
     
     # Check sentences start with capitals
-    sentences = re.split(r'[.!?]\s+', summary)
+    sentences = SENTENCE_BREAK_PATTERN.split(summary)
     for s in sentences:
         if s and s[0].islower():
             score -= 0.1
             break
     
     # Check for proper ending punctuation
-    if not re.search(r'[.!?]$', summary.strip()):
+    if not FINAL_PUNCT_PATTERN.search(summary.strip()):
         score -= 0.1
     
     # Reward having multiple sentences (shows structure)
@@ -308,13 +364,4 @@ def get_detailed_scores(summary: str,
     
     Useful for debugging and display.
     """
-    original = processed_input.get('normalized', '')
-    original_words = processed_input.get('word_count', 0)
-    
-    return {
-        'coverage': score_coverage(summary, original),
-        'brevity': score_brevity(summary, original_words),
-        'clarity': score_clarity(summary),
-        'consistency': score_consistency(summary),
-        'structure': score_structure(summary)
-    }
+    return dict(zip(SCORE_DIMENSIONS, score_components(summary, processed_input)))
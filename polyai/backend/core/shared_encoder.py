@@ -17,11 +17,14 @@ Why shared?
 
 import re
 import math
-from typing import Dict, List, Any, Set
+import heapq
+from typing import Dict, List, Any, Optional, FrozenSet, Tuple, Iterable
 from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
 
 # Stop words to filter out
-STOP_WORDS: Set[str] = {
+STOP_WORDS: FrozenSet[str] = frozenset({
     'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
     'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
     'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
@@ -34,7 +37,7 @@ STOP_WORDS: Set[str] = {
     'if', 'or', 'because', 'until', 'while', 'this', 'that', 'these',
     'those', 'it', 'its', 'i', 'you', 'he', 'she', 'we', 'they', 'what',
     'which', 'who', 'whom', 'their', 'your', 'our', 'my', 'his', 'her'
-}
+})
 
 # Key indicators that boost sentence importance
 KEY_INDICATORS: List[str] = [
@@ -45,13 +48,32 @@ KEY_INDICATORS: List[str] = [
     'consequently', 'hence', 'accordingly'
 ]
 
+# Indicators to scan for: one that contains another indicator (such as
+# 'in conclusion') can only match where the shorter one does
+INDICATOR_SCAN: Tuple[str, ...] = tuple(
+    indicator for indicator in KEY_INDICATORS
+    if not any(other != indicator and other in indicator for other in KEY_INDICATORS)
+)
 
-def encode(processed_input: Dict[str, Any]) -> Dict[str, Any]:
+LETTERS_PATTERN = re.compile(r'[a-z]+')
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Every field encode() can produce
+ENCODING_FIELDS: Tuple[str, ...] = (
+    'term_frequencies', 'tf_idf', 'keywords',
+    'sentence_scores', 'key_sentences', 'text_index'
+)
+
+
+def encode(processed_input: Dict[str, Any],
+           include: Optional[Iterable[str]] = None) -> Dict[str, Any]:
     """
     Create shared encoding for text.
     
     Args:
         processed_input: Output from input_processor.process()
+        include: Fields to return (default: all of ENCODING_FIELDS).
+            Stages only needed by omitted fields are skipped.
         
     Returns:
         Dictionary containing:
@@ -60,100 +82,180 @@ def encode(processed_input: Dict[str, Any]) -> Dict[str, Any]:
         - keywords: Extracted keywords with scores
         - sentence_scores: Importance score for each sentence
         - key_sentences: Indices of most important sentences
+        - text_index: Lookup indexes over the text (see index_text)
     """
+    wanted = frozenset(ENCODING_FIELDS if include is None else include)
+    
     if not processed_input or not processed_input.get('sentences'):
-        return {
+        return select_fields({
             "term_frequencies": {},
             "tf_idf": {},
             "keywords": [],
             "sentence_scores": [],
-            "key_sentences": []
-        }
+            "key_sentences": [],
+            "text_index": index_text('') if 'text_index' in wanted else {}
+        }, wanted)
+    
+    # Each stage is needed for its own field or by a later stage
+    need_scores = 'sentence_scores' in wanted or 'key_sentences' in wanted
+    need_keywords = need_scores or 'keywords' in wanted
+    need_tf_idf = need_keywords or 'tf_idf' in wanted
+    need_term_freq = need_keywords or 'term_frequencies' in wanted
     
     sentences = processed_input['sentences']
     words = processed_input.get('words', [])
     
+    # Lowercase each sentence once for the TF-IDF and scoring steps
+    sentences_lower = [s.lower() for s in sentences] if need_tf_idf else []
+    
+    term_freq: Dict[str, int] = {}
+    tf_idf: Dict[str, float] = {}
+    keywords: List[Dict[str, Any]] = []
+    sentence_scores: List[float] = []
+    key_sentences: List[int] = []
+    text_index: Dict[str, Any] = {}
+    
     # Step 1: Calculate term frequencies
-    term_freq = calculate_term_frequencies(words)
+    if need_term_freq:
+        term_freq = calculate_term_frequencies(words)
     
     # Step 2: Calculate TF-IDF scores
-    tf_idf = calculate_tf_idf(sentences)
+    if need_tf_idf:
+        tf_idf = calculate_tf_idf(sentences, sentences_lower)
     
     # Step 3: Extract keywords
-    keywords = extract_keywords(term_freq, tf_idf)
+    if need_keywords:
+        keywords = extract_keywords(term_freq, tf_idf)
     
-    # Step 4: Score sentences
-    sentence_scores = score_sentences(sentences, keywords, tf_idf)
+    if need_scores:
+        # Step 4: Score sentences
+        sentence_scores = score_sentences(sentences, keywords, tf_idf,
+                                          processed_input.get('sentence_words'),
+                                          sentences_lower)
+        
+        # Step 5: Identify key sentences (top 30%); nlargest matches a stable
+        # descending sort without sorting every sentence
+        n_key = max(1, len(sentences) // 3)
+        key_sentences = heapq.nlargest(n_key, range(len(sentence_scores)),
+                                       key=sentence_scores.__getitem__)
     
-    # Step 5: Identify key sentences (top 30%)
-    n_key = max(1, len(sentences) // 3)
-    sorted_indices = sorted(range(len(sentence_scores)), 
-                           key=lambda i: sentence_scores[i], 
-                           reverse=True)
-    key_sentences = sorted_indices[:n_key]
+    # Step 6: Index the text for agents that check claims against it
+    if 'text_index' in wanted:
+        text_index = index_text(processed_input.get('normalized', ''),
+                                processed_input.get('normalized_lower'))
     
-    return {
+    return select_fields({
         "term_frequencies": term_freq,
         "tf_idf": tf_idf,
         "keywords": keywords,
         "sentence_scores": sentence_scores,
-        "key_sentences": key_sentences
+        "key_sentences": key_sentences,
+        "text_index": text_index
+    }, wanted)
+
+
+def select_fields(encoding: Dict[str, Any], wanted: FrozenSet[str]) -> Dict[str, Any]:
+    """Keep only the requested encoding fields, in their usual order."""
+    if wanted.issuperset(encoding):
+        return encoding
+    return {field: value for field, value in encoding.items() if field in wanted}
+
+
+def index_text(text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build lookup indexes over the lowercased text.
+    
+    Returns dictionary containing:
+    - text_lower: Lowercased text
+    - word_set: Letter-only words, for whole-word lookups
+    - trigram_set: Every 3-word sequence of whitespace tokens
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    tokens = text_lower.split()
+    
+    word_set: FrozenSet[str] = frozenset(LETTERS_PATTERN.findall(text_lower))
+    trigram_set: FrozenSet[Tuple[str, str, str]] = frozenset(zip(tokens, tokens[1:], tokens[2:]))
+    
+    return {
+        "text_lower": text_lower,
+        "word_set": word_set,
+        "trigram_set": trigram_set
     }
 
 
 def calculate_term_frequencies(words: List[str]) -> Dict[str, int]:
     """Calculate frequency of each term, excluding stop words."""
-    filtered = [w.lower() for w in words 
-                if w.lower() not in STOP_WORDS and len(w) > 2]
-    return dict(Counter(filtered))
+    # Locals are faster than globals in the per-word loop; each word is
+    # lowercased once and streamed into the counter
+    stop_words = STOP_WORDS
+    return dict(Counter(w for w in map(str.lower, words) 
+                        if len(w) > 2 and w not in stop_words))
 
 
-def calculate_tf_idf(sentences: List[str]) -> Dict[str, float]:
+def calculate_tf_idf(sentences: List[str],
+                     sentences_lower: Optional[List[str]] = None) -> Dict[str, float]:
     """
     Calculate TF-IDF scores for all terms.
     
     TF-IDF = Term Frequency × Inverse Document Frequency
     Higher score = more important/distinctive term
+    
+    sentences_lower, when given, holds each sentence already lowercased.
     """
     if not sentences:
         return {}
     
+    if sentences_lower is None:
+        sentences_lower = [s.lower() for s in sentences]
+    
     n_docs = len(sentences)
     
     # Document frequency: how many sentences contain each term
     doc_freq: Dict[str, int] = {}
     
-    # Term frequency across all sentences
-    all_terms: List[str] = []
+    for sentence_lower in sentences_lower:
+        for word in sentence_terms(sentence_lower):
+            doc_freq[word] = doc_freq.get(word, 0) + 1
     
-    for sentence in sentences:
-        words = set(re.findall(r'\b\w+\b', sentence.lower()))
-        for word in words:
-            if word not in STOP_WORDS and len(word) > 2:
-                doc_freq[word] = doc_freq.get(word, 0) + 1
-                all_terms.append(word)
+    # Terms are counted once per sentence, so each term's count is its
+    # document frequency and no separate term list is needed
+    total_terms = sum(doc_freq.values()) or 1
     
-    # Calculate TF-IDF for each term
-    term_counts = Counter(all_terms)
-    total_terms = len(all_terms) or 1
-    
-    tf_idf: Dict[str, float] = {}
-    for term, count in term_counts.items():
-        tf = count / total_terms
-        df = doc_freq.get(term, 1)
+    # A term's TF-IDF depends only on its document frequency, and most
+    # terms share one of a few values, so compute each distinct score once
+    score_by_df: Dict[int, float] = {}
+    for df in set(doc_freq.values()):
+        tf = df / total_terms
         idf = math.log((n_docs + 1) / (df + 1)) + 1
-        tf_idf[term] = tf * idf
+        score_by_df[df] = tf * idf
+    
+    # Calculate TF-IDF for each term
+    tf_idf: Dict[str, float] = {term: score_by_df[df] for term, df in doc_freq.items()}
     
     return tf_idf
 
 
+@lru_cache(maxsize=4096)
+def sentence_terms(sentence_lower: str) -> Tuple[str, ...]:
+    """
+    Distinct TF-IDF terms of a lowercased sentence, excluding stop words.
+    
+    Cached: boilerplate sentences recur across documents.
+    """
+    stop_words = STOP_WORDS
+    return tuple(word for word in set(WORD_PATTERN.findall(sentence_lower))
+                 if word not in stop_words and len(word) > 2)
+
+
 def extract_keywords(term_freq: Dict[str, int], 
                     tf_idf: Dict[str, float],
                     top_n: int = 15) -> List[Dict[str, Any]]:
     """
     Extract top keywords based on frequency and TF-IDF.
     
-    Returns list of keywords with their scores.
+    Returns list of keywords with their scores. Terms are already
+    lowercase (term_freq keys are), so consumers can use them as-is.
     """
     if not term_freq:
         return []
@@ -163,23 +265,28 @@ def extract_keywords(term_freq: Dict[str, int],
     max_freq = max(term_freq.values()) or 1
     max_tfidf = max(tf_idf.values()) if tf_idf else 1
     
+    # Normalize by multiplying with reciprocals computed once
+    inv_freq = 1 / max_freq
+    inv_tfidf = 1 / max_tfidf if max_tfidf else 0
+    
     for term, freq in term_freq.items():
-        norm_freq = freq / max_freq
-        norm_tfidf = tf_idf.get(term, 0) / max_tfidf if max_tfidf else 0
+        norm_freq = freq * inv_freq
+        norm_tfidf = tf_idf.get(term, 0) * inv_tfidf
         # Combined score: weighted average
         combined_scores[term] = (0.4 * norm_freq) + (0.6 * norm_tfidf)
     
-    # Sort and get top keywords
-    sorted_terms = sorted(combined_scores.items(), 
-                         key=lambda x: x[1], 
-                         reverse=True)
+    # Get top keywords (same order as a stable descending sort)
+    top_terms = heapq.nlargest(top_n, combined_scores.items(), 
+                               key=itemgetter(1))
     
-    return [{"term": t, "score": round(s, 4)} for t, s in sorted_terms[:top_n]]
+    return [{"term": t, "score": round(s, 4)} for t, s in top_terms]
 
 
 def score_sentences(sentences: List[str], 
                    keywords: List[Dict[str, Any]],
-                   tf_idf: Dict[str, float]) -> List[float]:
+                   tf_idf: Dict[str, float],
+                   sentence_words: Optional[List[List[str]]] = None,
+                   sentences_lower: Optional[List[str]] = None) -> List[float]:
     """
     Score each sentence for importance.
     
@@ -188,17 +295,23 @@ def score_sentences(sentences: List[str],
     - Keyword density
     - Key indicator presence
     - Sentence length (prefer medium length)
+    
+    sentence_words, when given, holds the pre-tokenized lowercased
+    words of each sentence (from input_processor) and avoids re-splitting.
+    sentences_lower likewise holds each sentence already lowercased.
     """
     if not sentences:
         return []
     
-    keyword_set = {kw['term'].lower() for kw in keywords}
+    keyword_set = {kw['term'] for kw in keywords}
+    is_keyword = keyword_set.__contains__
     scores = []
     n = len(sentences)
     
     for i, sentence in enumerate(sentences):
         score = 0.0
-        words = sentence.lower().split()
+        sentence_lower = sentences_lower[i] if sentences_lower else sentence.lower()
+        words = sentence_words[i] if sentence_words else sentence_lower.split()
         word_count = len(words)
         
         # Position score (first 2 and last sentence)
@@ -207,14 +320,13 @@ def score_sentences(sentences: List[str],
         if i == n - 1:
             score += 0.2
         
-        # Keyword density
-        keyword_matches = sum(1 for w in words if w in keyword_set)
+        # Keyword density (map over the bound C method, no generator)
+        keyword_matches = sum(map(is_keyword, words))
         if word_count > 0:
             score += 0.3 * (keyword_matches / word_count)
         
         # Key indicator bonus
-        sentence_lower = sentence.lower()
-        for indicator in KEY_INDICATORS:
+        for indicator in INDICATOR_SCAN:
             if indicator in sentence_lower:
                 score += 0.15
                 break  # Only count once
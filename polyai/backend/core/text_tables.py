@@ -0,0 +1,15 @@
+"""
+PolyAI Text Tables
+
+Purpose: Translation tables shared by the agents and the scoring engine.
+Building them once at import keeps per-call text handling to a single
+str.translate / bytes.translate pass.
+"""
+
+
+# Deletes sentence punctuation from a whole string at once
+PUNCT_TABLE = str.maketrans('', '', '.,!?;:')
+
+# Byte table keeping vowels and blanking everything else, so vowel groups
+# become whitespace-separated tokens (used for syllable estimates)
+VOWEL_TABLE = bytes(c if chr(c) in 'aeiouy' else ord(' ') for c in range(256))
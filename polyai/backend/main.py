@@ -7,8 +7,16 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+import asyncio
+import hashlib
+import logging
+import os
 import time
 
 # Import core engine components
@@ -26,13 +34,65 @@ from core.agents import (
     critique_agent
 )
 
+logger = logging.getLogger(__name__)
+
+# ========================================
+# Worker Pool
+# ========================================
+# The pipeline is CPU-bound pure Python, so each request runs in a worker
+# process. This keeps the event loop free and lets concurrent requests use
+# separate cores instead of queueing behind the GIL.
+PIPELINE_POOL: Optional[ProcessPoolExecutor] = None
+PIPELINE_WORKERS = os.cpu_count() or 1
+
+# Opt-in fast path: when reasoning is near-certain on a short input, the
+# secondary agents are skipped and its draft goes straight to debate and
+# refinement. Enable with POLYAI_FAST_PATH=1.
+# Reasoning confidence peaks at 0.88 (half the sentences selected, three
+# or more key points), so the threshold sits just below that.
+FAST_PATH_ENABLED = os.environ.get("POLYAI_FAST_PATH") == "1"
+FAST_PATH_MIN_CONFIDENCE = 0.85
+FAST_PATH_MAX_WORDS = 300
+
+
+# Sample text run at startup so the first real request doesn't pay for
+# worker processes spinning up, regex compilation or lazy state
+WARMUP_TEXT = (
+    "PolyAI summarizes text offline with several small agents. "
+    "However, each agent must utilize the shared encoding in order to "
+    "demonstrate significant results, which is important because the "
+    "debate engine compares their outputs and selects the best summary. "
+) * 5
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the worker pool and warm up every worker at startup."""
+    global PIPELINE_POOL
+    PIPELINE_POOL = ProcessPoolExecutor(max_workers=PIPELINE_WORKERS)
+    try:
+        await asyncio.gather(*(_run_pipeline(WARMUP_TEXT) for _ in range(PIPELINE_WORKERS)))
+    except Exception:
+        # Warm-up is best effort; never block startup, but surface
+        # failures such as a worker that cannot import the core engine
+        logger.exception("Pipeline warm-up failed")
+    yield
+    PIPELINE_POOL.shutdown(wait=False, cancel_futures=True)
+    PIPELINE_POOL = None
+
+
 # ========================================
 # FastAPI App Configuration
 # ========================================
+# Endpoints with a response_model are serialized straight to JSON bytes
+# by pydantic-core (FastAPI >= 0.130), so the default response class is
+# already the fast path; a custom class such as ORJSONResponse would
+# bypass it.
 app = FastAPI(
     title="PolyAI",
     description="Offline Multi-Agent AI Summarization Engine",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Enable CORS for local frontend
@@ -44,11 +104,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (debug payloads, batches) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # ========================================
 # Request/Response Models
 # ========================================
 class SummarizeRequest(BaseModel):
-    text: str
+    # Length limits are enforced by pydantic-core while parsing the body;
+    # surrounding whitespace is stripped first, so it doesn't count
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    text: str = Field(min_length=50, max_length=50000)
     debug: Optional[bool] = False
     max_length: Optional[int] = 500
 
@@ -62,6 +129,250 @@ class SummarizeResponse(BaseModel):
     agents: Optional[Dict[str, AgentResult]] = None
     stats: Dict[str, Any]
 
+# A batch may hold at most this many texts, each within the /summarize
+# length limit, and run at most as many at once as the pool has workers
+# (but always allows the default of 4)
+BATCH_MAX_ITEMS = 32
+BATCH_MAX_CONCURRENCY = max(PIPELINE_WORKERS, 4)
+
+class BatchRequest(BaseModel):
+    items: List[SummarizeRequest] = Field(min_length=1, max_length=BATCH_MAX_ITEMS)
+    max_concurrency: int = Field(default=4, ge=1, le=BATCH_MAX_CONCURRENCY)
+
+# ========================================
+# Caches
+# ========================================
+# Completed summaries keyed by (sha256 of input text, max_length).
+# Repeat requests (frontend retries, benchmark reruns) skip the pipeline.
+SUMMARY_CACHE_SIZE = 1024
+_summary_cache: "OrderedDict[Tuple[str, Optional[int]], Dict[str, Any]]" = OrderedDict()
+
+# Processed input keyed by raw text digest, encoding keyed by normalized
+# text digest. Both stages are deterministic, so debug requests and texts
+# that only differ in stripped noise reuse earlier work. They are filled
+# inside the worker processes, so each worker keeps its own copy and a
+# repeat only hits when it lands on a worker that has seen the text; the
+# hit rate drops by up to a factor of PIPELINE_WORKERS.
+STAGE_CACHE_SIZE = 512
+_process_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_encode_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Optional[Dict[str, Any]]:
+    """Look up a cached entry and mark it as recently used."""
+    entry = cache.get(key)
+    if entry is not None:
+        cache.move_to_end(key)
+    return entry
+
+
+def _cache_put(cache: OrderedDict, key: Any, entry: Dict[str, Any], max_size: int) -> None:
+    """Store an entry, evicting the least recently used one when full."""
+    cache[key] = entry
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def _digest(text: str) -> bytes:
+    """Short content key for the stage caches."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+# ========================================
+# Pipeline
+# ========================================
+# Encoding fields the agents read. Term frequencies and TF-IDF scores
+# only feed the encoder's own stages, so they are not computed.
+AGENT_ENCODING_FIELDS = ("keywords", "sentence_scores", "key_sentences", "text_index")
+
+# Agents that only depend on the reasoning result
+SECONDARY_AGENTS = {
+    "verification": verification_agent,
+    "simplification": simplification_agent,
+    "critique": critique_agent
+}
+
+
+async def _run_pipeline(text: str) -> Dict[str, Any]:
+    """
+    Run steps 1-5 of the pipeline on the worker pool.
+    
+    The whole pipeline for one request is a single pool task, so the
+    intermediate results never cross the process boundary; concurrent
+    requests spread across the workers. The event loop is never blocked.
+    
+    Returns the final summary, its word statistics and the raw
+    agent outputs (needed for debug responses).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(PIPELINE_POOL, _pipeline, text)
+
+
+def _pipeline(text: str) -> Dict[str, Any]:
+    """
+    Run the pipeline on one text (executed in a worker process).
+    
+    The stage caches are therefore per worker.
+    """
+    # Step 1: Input Processing
+    process_key = _digest(text)
+    processed = _cache_get(_process_cache, process_key)
+    if processed is None:
+        processed = input_processor.process(text)
+        _cache_put(_process_cache, process_key, processed, STAGE_CACHE_SIZE)
+    
+    # Step 2: Shared Encoding
+    encode_key = _digest(processed['normalized'])
+    encoding = _cache_get(_encode_cache, encode_key)
+    if encoding is None:
+        encoding = shared_encoder.encode(processed, include=AGENT_ENCODING_FIELDS)
+        _cache_put(_encode_cache, encode_key, encoding, STAGE_CACHE_SIZE)
+    
+    # Step 3a: Reasoning (every other agent builds on its draft)
+    reasoning_result = reasoning_agent.run(processed, encoding)
+    agent_results = {"reasoning": reasoning_result}
+    
+    # Step 3b: Secondary agents (unless the fast path applies)
+    if not _use_fast_path(text, reasoning_result):
+        for name, agent in SECONDARY_AGENTS.items():
+            agent_results[name] = agent.run(processed, encoding, reasoning_result)
+    
+    # Steps 4-5: Debate, Scoring and Refinement
+    return _finish(text, processed, agent_results)
+
+
+def _use_fast_path(text: str, reasoning_result: Dict[str, Any]) -> bool:
+    """Check whether the secondary agents can be skipped for this input."""
+    return (
+        FAST_PATH_ENABLED
+        and reasoning_result.get("confidence", 0) >= FAST_PATH_MIN_CONFIDENCE
+        and len(text.split()) < FAST_PATH_MAX_WORDS
+    )
+
+
+def _finish(text: str,
+            processed: Dict[str, Any],
+            agent_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Score and debate the agent outputs, refine the winner and compute stats."""
+    # Step 4: Debate & Scoring
+    scores = scoring_engine.score_all(agent_results, processed)
+    debate_result = debate_engine.debate(agent_results, scores)
+    
+    # Step 5: Output Refinement
+    final_summary = output_refiner.refine(debate_result, agent_results)
+    
+    original_words = len(text.split())
+    summary_words = len(final_summary.split())
+    compression = round((1 - summary_words / original_words) * 100)
+    
+    return {
+        "summary": final_summary,
+        "stats": {
+            "original_words": original_words,
+            "summary_words": summary_words,
+            "compression_percent": compression
+        },
+        "agent_results": agent_results
+    }
+
+
+def _build_agent_details(agent_results: Dict[str, Dict[str, Any]]) -> Dict[str, AgentResult]:
+    """
+    Build the per-agent debug section of the response.
+    
+    Agents skipped by the fast path report empty defaults.
+    """
+    reasoning_result = agent_results["reasoning"]
+    verification_result = agent_results.get("verification", {})
+    simplification_result = agent_results.get("simplification", {})
+    critique_result = agent_results.get("critique", {})
+    
+    return {
+        "reasoning": AgentResult(
+            summary=reasoning_result.get("summary"),
+            confidence=reasoning_result.get("confidence", 0),
+            details={
+                "key_points": reasoning_result.get("key_points", []),
+                "sentence_count": reasoning_result.get("sentence_count", 0)
+            }
+        ),
+        "verification": AgentResult(
+            confidence=verification_result.get("confidence", 0),
+            details={
+                "verified": verification_result.get("verified", False),
+                "coverage": verification_result.get("coverage", 0),
+                "issues": verification_result.get("issues", [])
+            }
+        ),
+        "simplification": AgentResult(
+            summary=simplification_result.get("summary"),
+            confidence=simplification_result.get("confidence", 0),
+            details={
+                "readability_improved": simplification_result.get("readability_improved", False),
+                "avg_word_length": simplification_result.get("avg_word_length", 0)
+            }
+        ),
+        "critique": AgentResult(
+            confidence=critique_result.get("confidence", 0),
+            details={
+                "quality": critique_result.get("quality", "Unknown"),
+                "compression_ratio": critique_result.get("compression_ratio", 0),
+                "issues": critique_result.get("issues", [])
+            }
+        )
+    }
+
+
+async def _summarize_impl(request: SummarizeRequest) -> SummarizeResponse:
+    """
+    Produce the response for a single (already validated) request.
+    
+    Shared by /summarize and /summarize_batch. Non-debug results are
+    cached by input hash, so repeated texts skip the pipeline.
+    """
+    start_time = time.time()
+    
+    try:
+        # Debug output includes agent internals, so always compute it fresh
+        cache_key = None
+        result = None
+        if not request.debug:
+            text_hash = hashlib.sha256(request.text.encode()).hexdigest()
+            cache_key = (text_hash, request.max_length)
+            result = _cache_get(_summary_cache, cache_key)
+        
+        if result is None:
+            result = await _run_pipeline(request.text)
+            if cache_key is not None:
+                _cache_put(_summary_cache, cache_key, {
+                    "summary": result["summary"],
+                    "stats": result["stats"]
+                }, SUMMARY_CACHE_SIZE)
+        
+        # Calculate stats
+        end_time = time.time()
+        latency_ms = round((end_time - start_time) * 1000)
+        
+        # Build response
+        response = SummarizeResponse(
+            summary=result["summary"],
+            stats={**result["stats"], "latency_ms": latency_ms}
+        )
+        
+        # Include agent details if debug mode
+        if request.debug:
+            response.agents = _build_agent_details(result["agent_results"])
+        
+        return response
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Processing error: {str(e)}"
+        )
+
+
 # ========================================
 # API Endpoints
 # ========================================
@@ -97,115 +408,46 @@ async def summarize(request: SummarizeRequest):
     Orchestrates the multi-agent debate pipeline:
     1. Input Processing - Normalize and clean text
     2. Shared Encoding - Create text representation
-    3. Agent Execution - Run all 4 agents
+    3. Agent Execution - Run reasoning, then the other 3 agents, in one
+       worker process (requests run in parallel across the pool)
     4. Debate & Scoring - Evaluate agent outputs
     5. Output Refinement - Merge into final summary
     """
-    start_time = time.time()
+    return await _summarize_impl(request)
+
+
+@app.post("/summarize_batch", response_model=List[SummarizeResponse])
+async def summarize_batch(request: BatchRequest):
+    """
+    Summarize several texts in one call.
     
-    # Validate input
-    if not request.text or len(request.text.strip()) < 50:
-        raise HTTPException(
-            status_code=400,
-            detail="Text must be at least 50 characters long"
-        )
+    Items run concurrently (at most max_concurrency at a time) and
+    identical items within the batch are only computed once.
+    Responses are returned in the same order as the items.
     
-    if len(request.text) > 50000:
-        raise HTTPException(
-            status_code=400,
-            detail="Text exceeds maximum length of 50,000 characters"
-        )
+    The batch succeeds or fails as a whole: if any item fails, the
+    request returns that item's error, the remaining items are
+    cancelled and no results are returned.
+    """
+    semaphore = asyncio.Semaphore(request.max_concurrency)
+    
+    async def guarded(item: SummarizeRequest) -> SummarizeResponse:
+        async with semaphore:
+            return await _summarize_impl(item)
+    
+    pending: Dict[Tuple[str, Optional[int], Optional[bool]], asyncio.Future] = {}
+    keys = []
+    for item in request.items:
+        key = (item.text, item.max_length, item.debug)
+        if key not in pending:
+            pending[key] = asyncio.ensure_future(guarded(item))
+        keys.append(key)
     
     try:
-        # Step 1: Input Processing
-        processed = input_processor.process(request.text)
-        
-        # Step 2: Shared Encoding
-        encoding = shared_encoder.encode(processed)
-        
-        # Step 3: Run Agents
-        reasoning_result = reasoning_agent.run(processed, encoding)
-        verification_result = verification_agent.run(processed, encoding, reasoning_result)
-        simplification_result = simplification_agent.run(processed, encoding, reasoning_result)
-        critique_result = critique_agent.run(processed, encoding, reasoning_result)
-        
-        agent_results = {
-            "reasoning": reasoning_result,
-            "verification": verification_result,
-            "simplification": simplification_result,
-            "critique": critique_result
-        }
-        
-        # Step 4: Debate & Scoring
-        scores = scoring_engine.score_all(agent_results, processed)
-        debate_result = debate_engine.debate(agent_results, scores)
-        
-        # Step 5: Output Refinement
-        final_summary = output_refiner.refine(debate_result, agent_results)
-        
-        # Calculate stats
-        end_time = time.time()
-        latency_ms = round((end_time - start_time) * 1000)
-        
-        original_words = len(request.text.split())
-        summary_words = len(final_summary.split())
-        compression = round((1 - summary_words / original_words) * 100)
-        
-        # Build response
-        response = SummarizeResponse(
-            summary=final_summary,
-            stats={
-                "original_words": original_words,
-                "summary_words": summary_words,
-                "compression_percent": compression,
-                "latency_ms": latency_ms
-            }
-        )
-        
-        # Include agent details if debug mode
-        if request.debug:
-            response.agents = {
-                "reasoning": AgentResult(
-                    summary=reasoning_result.get("summary"),
-                    confidence=reasoning_result.get("confidence", 0),
-                    details={
-                        "key_points": reasoning_result.get("key_points", []),
-                        "sentence_count": reasoning_result.get("sentence_count", 0)
-                    }
-                ),
-                "verification": AgentResult(
-                    confidence=verification_result.get("confidence", 0),
-                    details={
-                        "verified": verification_result.get("verified", False),
-                        "coverage": verification_result.get("coverage", 0),
-                        "issues": verification_result.get("issues", [])
-                    }
-                ),
-                "simplification": AgentResult(
-                    summary=simplification_result.get("summary"),
-                    confidence=simplification_result.get("confidence", 0),
-                    details={
-                        "readability_improved": simplification_result.get("readability_improved", False),
-                        "avg_word_length": simplification_result.get("avg_word_length", 0)
-                    }
-                ),
-                "critique": AgentResult(
-                    confidence=critique_result.get("confidence", 0),
-                    details={
-                        "quality": critique_result.get("quality", "Unknown"),
-                        "compression_ratio": critique_result.get("compression_ratio", 0),
-                        "issues": critique_result.get("issues", [])
-                    }
-                )
-            }
-        
-        return response
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Processing error: {str(e)}"
-        )
+        return await asyncio.gather(*(pending[key] for key in keys))
+    finally:
+        for future in pending.values():
+            future.cancel()
 
 
 # ========================================
@@ -0,0 +1,54 @@
+# Tests for the opt-in fast path of the pipeline
+#
+# Run from polyai/backend with: python -m unittest
+
+import unittest
+from unittest import mock
+
+import main
+
+
+# Six sentences with a conclusion: reasoning selects half of them and
+# finds three key points, which gives its peak confidence of 0.88
+CONFIDENT_TEXT = (
+    "Solar panels convert sunlight into electricity for homes. "
+    "Modern solar panels reach efficiency above twenty percent in full sun. "
+    "Battery storage lets households use solar power after sunset. "
+    "Installation costs for solar panels have fallen sharply over the last decade. "
+    "Many governments offer tax credits that reduce the price of solar panels. "
+    "In conclusion, solar power is now an affordable choice for most homes."
+)
+
+
+class FastPathTest(unittest.TestCase):
+
+    def test_fast_path_skips_secondary_agents(self):
+        with mock.patch.object(main, "FAST_PATH_ENABLED", True):
+            result = main._pipeline(CONFIDENT_TEXT)
+        
+        reasoning_result = result["agent_results"]["reasoning"]
+        self.assertGreaterEqual(reasoning_result["confidence"], main.FAST_PATH_MIN_CONFIDENCE)
+        self.assertEqual(list(result["agent_results"]), ["reasoning"])
+        self.assertTrue(result["summary"])
+
+    def test_fast_path_disabled_runs_all_agents(self):
+        with mock.patch.object(main, "FAST_PATH_ENABLED", False):
+            result = main._pipeline(CONFIDENT_TEXT)
+        
+        self.assertEqual(
+            list(result["agent_results"]),
+            ["reasoning", *main.SECONDARY_AGENTS]
+        )
+
+    def test_long_input_runs_all_agents(self):
+        long_text = " ".join([CONFIDENT_TEXT] * 5)
+        self.assertGreaterEqual(len(long_text.split()), main.FAST_PATH_MAX_WORDS)
+        
+        with mock.patch.object(main, "FAST_PATH_ENABLED", True):
+            result = main._pipeline(long_text)
+        
+        self.assertEqual(len(result["agent_results"]), 1 + len(main.SECONDARY_AGENTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# Tests for the simplification agent's combined replacement patterns
+#
+# Run from polyai/backend with: python -m unittest
+
+import unittest
+
+import main
+from core.agents import simplification_agent
+
+
+class UnicodeCaseVariantTest(unittest.TestCase):
+    """
+    The patterns match case-insensitively, so Unicode case variants such
+    as 'İ', 'ı' and 'ſ' match ASCII table entries even though they do not
+    lowercase to them.
+    """
+
+    def test_simplify_vocabulary(self):
+        self.assertEqual(
+            simplification_agent.simplify_vocabulary("İNDİCATE the results clearly now."),
+            ("SHOW the results clearly now.", 1)
+        )
+        self.assertEqual(
+            simplification_agent.simplify_vocabulary("We utılize ſufficient data."),
+            ("We use enough data.", 2)
+        )
+
+    def test_remove_redundancy(self):
+        self.assertEqual(
+            simplification_agent.remove_redundancy("We act ın order to win."),
+            ("We act to win.", 1)
+        )
+        self.assertEqual(
+            simplification_agent.remove_redundancy("Baſically, it works."),
+            (", it works.", 1)
+        )
+
+    def test_pipeline(self):
+        for text in ("İNDİCATE the results clearly now. " * 5,
+                     "We measure ın order to learn from the results. " * 5):
+            result = main._pipeline(text)
+            self.assertTrue(result["summary"])
+
+
+if __name__ == "__main__":
+    unittest.main()